@@ -5,114 +5,128 @@ This script demonstrates how to run the 5-card Kuhn Poker solver
 with custom starting strategies.
 """
 
+import functools
+import hashlib
 import sys
 sys.path.append('..')
 
+import kuhn_poker_solver
 from kuhn_poker_solver import EquilibriumSolver
+import numpy as np
 import pandas as pd
 
+# Optional: cache solver runs on disk with joblib
+try:
+    from joblib import Memory
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+# Fingerprint of the solver source, part of the cache key so that results
+# cached by an older version of kuhn_poker_solver.py are not reused
+with open(kuhn_poker_solver.__file__, 'rb') as f:
+    SOLVER_VERSION = hashlib.sha256(f.read()).hexdigest()
+
+
+def _get_solver(n, dtype=np.float64):
+    """Return a shared solver for n cards (solve() copies its inputs)."""
+    # Normalise the key so _get_solver(5) and _get_solver(5, np.float64) share a solver
+    return _cached_solver(int(n), np.dtype(dtype).type)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_solver(n, dtype):
+    return EquilibriumSolver(n=n, dtype=dtype)
+
+
+def solve_cached(p1_start, p2_start, solver_version=SOLVER_VERSION, **solve_kwargs):
+    """
+    Run EquilibriumSolver.solve, reusing the results of identical earlier runs.
+    
+    With joblib installed, results are stored in ./.solver_cache keyed on the
+    starting strategies, solver settings and solver_version, so re-running
+    the same experiment is read straight from disk while any edit to
+    kuhn_poker_solver.py starts a fresh entry. Without joblib this simply
+    solves.
+    
+    Args:
+        p1_start: Player 1 starting strategy (5 x n array); its dtype
+            (float64 or float32) selects the solver precision
+        p2_start: Player 2 starting strategy (4 x n array)
+        solver_version: Cache key for the solver code; leave at the default
+        **solve_kwargs: Passed through to EquilibriumSolver.solve
+        
+    Returns:
+        List of found equilibria
+    """
+    p1_start = np.asarray(p1_start)
+    p2_start = np.asarray(p2_start)
+    solver = _get_solver(p1_start.shape[1], p1_start.dtype.type)
+    return solver.solve(p1_start, p2_start, **solve_kwargs)
+
+
+if JOBLIB_AVAILABLE:
+    solve_cached = Memory('./.solver_cache', verbose=0).cache(solve_cached)
+
+
+# Custom starting strategies
+# These are strategies from the thesis that converged well
+
+# Player 1 custom strategy
+# Row 0: P(Check with card), Row 1: P(Bet with card)
+# Row 2: P(Fold1), Row 3: P(Fold2), Row 4: P(Call)
+P1_CUSTOM = np.array([
+    # Card 1  Card 2  Card 3  Card 4  Card 5
+    [0.664,   0.0,    0.0,    0.439,  0.457],  # Check (card 1 bluffs sometimes)
+    [0.336,   1.0,    1.0,    0.561,  0.543],  # Bet
+    [0.0,     0.0,    0.0,    0.0,    0.0],    # No fold in first node
+    [1.0,     0.871,  0.134,  0.0,    0.0],    # Fold to bet (always with 1)
+    [0.0,     0.129,  0.866,  1.0,    1.0],    # Call (never with 1)
+], dtype=np.float64)
+
+# Player 2 custom strategy
+# Row 0: P(Bet/Check in left node), Row 1: P(Check/Fold in left node)
+# Row 2: P(Call in right node), Row 3: P(Fold in right node)
+P2_CUSTOM = np.array([
+    # Card 1  Card 2  Card 3  Card 4  Card 5
+    [0.244,   1.0,    1.0,    0.0,    0.0],
+    [0.756,   0.0,    0.0,    1.0,    1.0],
+    [0.0,     0.126,  0.64,   1.0,    1.0],
+    [1.0,     0.874,  0.36,   0.0,    0.0],
+], dtype=np.float64)
+
 
 def run_custom_solver():
     """
     Run solver with a custom starting strategy.
+    
+    Report output is collected into a list and written in one go
+    before and after the solver runs.
     """
-    print("5-Card Kuhn Poker - Custom Solver Example")
-    print("=" * 60)
+    lines = []
+    lines.append("5-Card Kuhn Poker - Custom Solver Example")
+    lines.append("=" * 60)
     
     # Initialize solver
-    solver = EquilibriumSolver(n=5)
-    
-    # Get base strategy matrices
-    p1_custom, p2_custom = solver.strategy_mgr.create_strategy_matrix()
-    
-    # Define custom starting strategies
-    # These are strategies from the thesis that converged well
-    
-    # Player 1 custom strategy
-    # Row 0: P(Check with card), Row 1: P(Bet with card)
-    # Row 2: P(Fold1), Row 3: P(Fold2), Row 4: P(Call)
-    
-    # Card 1 (worst card)
-    p1_custom.iloc[0, 0] = 0.664  # Check
-    p1_custom.iloc[1, 0] = 0.336  # Bet (bluff sometimes)
-    p1_custom.iloc[2, 0] = 0.0    # No fold in first node
-    p1_custom.iloc[3, 0] = 1.0    # Always fold to bet
-    p1_custom.iloc[4, 0] = 0.0    # Never call with 1
-    
-    # Card 2
-    p1_custom.iloc[0, 1] = 0.0
-    p1_custom.iloc[1, 1] = 1.0
-    p1_custom.iloc[2, 1] = 0.0
-    p1_custom.iloc[3, 1] = 0.871
-    p1_custom.iloc[4, 1] = 0.129
-    
-    # Card 3
-    p1_custom.iloc[0, 2] = 0.0
-    p1_custom.iloc[1, 2] = 1.0
-    p1_custom.iloc[2, 2] = 0.0
-    p1_custom.iloc[3, 2] = 0.134
-    p1_custom.iloc[4, 2] = 0.866
-    
-    # Card 4
-    p1_custom.iloc[0, 3] = 0.439
-    p1_custom.iloc[1, 3] = 0.561
-    p1_custom.iloc[2, 3] = 0.0
-    p1_custom.iloc[3, 3] = 0.0
-    p1_custom.iloc[4, 3] = 1.0
-    
-    # Card 5 (best card)
-    p1_custom.iloc[0, 4] = 0.457
-    p1_custom.iloc[1, 4] = 0.543
-    p1_custom.iloc[2, 4] = 0.0
-    p1_custom.iloc[3, 4] = 0.0
-    p1_custom.iloc[4, 4] = 1.0
-    
-    # Player 2 custom strategy
-    # Row 0: P(Bet/Check in left node), Row 1: P(Check/Fold in left node)
-    # Row 2: P(Call in right node), Row 3: P(Fold in right node)
-    
-    # Card 1
-    p2_custom.iloc[0, 0] = 0.244
-    p2_custom.iloc[1, 0] = 0.756
-    p2_custom.iloc[2, 0] = 0.0
-    p2_custom.iloc[3, 0] = 1.0
-    
-    # Card 2
-    p2_custom.iloc[0, 1] = 1.0
-    p2_custom.iloc[1, 1] = 0.0
-    p2_custom.iloc[2, 1] = 0.126
-    p2_custom.iloc[3, 1] = 0.874
-    
-    # Card 3
-    p2_custom.iloc[0, 2] = 1.0
-    p2_custom.iloc[1, 2] = 0.0
-    p2_custom.iloc[2, 2] = 0.64
-    p2_custom.iloc[3, 2] = 0.36
-    
-    # Card 4
-    p2_custom.iloc[0, 3] = 0.0
-    p2_custom.iloc[1, 3] = 1.0
-    p2_custom.iloc[2, 3] = 1.0
-    p2_custom.iloc[3, 3] = 0.0
-    
-    # Card 5
-    p2_custom.iloc[0, 4] = 0.0
-    p2_custom.iloc[1, 4] = 1.0
-    p2_custom.iloc[2, 4] = 1.0
-    p2_custom.iloc[3, 4] = 0.0
-    
-    print("\nStarting Strategies:")
-    print("\nPlayer 1:")
-    print(p1_custom)
-    print("\nPlayer 2:")
-    print(p2_custom)
+    solver = _get_solver(5)
+    
+    # Custom starting strategies (columns are cards 1-5); solve() copies them
+    p1_custom = P1_CUSTOM
+    p2_custom = P2_CUSTOM
+    
+    lines.append("\nStarting Strategies:")
+    lines.append("\nPlayer 1:")
+    lines.append(str(solver.strategy_mgr.to_dataframe(p1_custom, 1)))
+    lines.append("\nPlayer 2:")
+    lines.append(str(solver.strategy_mgr.to_dataframe(p2_custom, 2)))
     
     # Run solver with custom strategies
-    print("\n" + "=" * 60)
-    print("Running solver...")
-    print("=" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append("Running solver...")
+    lines.append("=" * 60)
+    print("\n".join(lines))
     
-    results = solver.solve(
+    results = solve_cached(
         p1_custom, p2_custom,
         max_iterations=5000,  # Fewer iterations for example
         epsilon=0.0001,
@@ -120,83 +134,97 @@ def run_custom_solver():
     )
     
     # Display results
-    print("\n" + "=" * 60)
-    print("RESULTS")
-    print("=" * 60)
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("RESULTS")
+    lines.append("=" * 60)
     
     if results:
-        print(f"\nFound {len(results)} equilibrium/equilibria\n")
+        lines.append(f"\nFound {len(results)} equilibrium/equilibria\n")
         
+        # Format all EVs in one call rather than one f-string per value
+        evs = np.array([(r['ev_player1'], r['ev_player2']) for r in results])
+        ev_text = np.char.mod('%.6f', evs)
         for i, result in enumerate(results):
-            print(f"\nEquilibrium #{i+1}:")
-            print(f"  Iteration: {result['iteration']}")
-            print(f"  Player 1 EV: {result['ev_player1']:.6f}")
-            print(f"  Player 2 EV: {result['ev_player2']:.6f}")
+            lines.append(f"\nEquilibrium #{i+1}:")
+            lines.append(f"  Iteration: {result['iteration']}")
+            lines.append(f"  Player 1 EV: {ev_text[i, 0]}")
+            lines.append(f"  Player 2 EV: {ev_text[i, 1]}")
         
         # Show final equilibrium in detail
-        print("\n" + "=" * 60)
-        print("FINAL EQUILIBRIUM STRATEGIES")
-        print("=" * 60)
+        lines.append("\n" + "=" * 60)
+        lines.append("FINAL EQUILIBRIUM STRATEGIES")
+        lines.append("=" * 60)
         
         final = results[-1]
-        print("\nPlayer 1 Strategy:")
-        print(final['player1_strategy'].round(4))
-        print("\nPlayer 2 Strategy:")
-        print(final['player2_strategy'].round(4))
+        lines.append("\nPlayer 1 Strategy:")
+        lines.append(str(solver.strategy_mgr.to_dataframe(final['player1_strategy'], 1).round(4)))
+        lines.append("\nPlayer 2 Strategy:")
+        lines.append(str(solver.strategy_mgr.to_dataframe(final['player2_strategy'], 2).round(4)))
         
-        print("\n" + "=" * 60)
-        print("INTERPRETATION")
-        print("=" * 60)
+        lines.append("\n" + "=" * 60)
+        lines.append("INTERPRETATION")
+        lines.append("=" * 60)
         
-        print("\nPlayer 1 with card 3 (middle card):")
-        p1_card3 = final['player1_strategy'].iloc[:, 2]
-        print(f"  Bets {p1_card3[0]*100:.1f}% of the time")
-        print(f"  Checks {p1_card3[1]*100:.1f}% of the time")
-        print(f"  When facing a bet: calls {p1_card3[4]*100:.1f}%, folds {p1_card3[3]*100:.1f}%")
+        lines.append("\nPlayer 1 with card 3 (middle card):")
+        bet, check, _, fold, call = np.asarray(final['player1_strategy'])[:, 2]
+        lines.append(f"  Bets {bet*100:.1f}% of the time")
+        lines.append(f"  Checks {check*100:.1f}% of the time")
+        lines.append(f"  When facing a bet: calls {call*100:.1f}%, folds {fold*100:.1f}%")
         
-        print("\nPlayer 2 with card 3 (middle card):")
-        p2_card3 = final['player2_strategy'].iloc[:, 2]
-        print(f"  After P1 checks: bets {p2_card3[0]*100:.1f}%, checks {p2_card3[1]*100:.1f}%")
-        print(f"  After P1 bets: calls {p2_card3[2]*100:.1f}%, folds {p2_card3[3]*100:.1f}%")
+        lines.append("\nPlayer 2 with card 3 (middle card):")
+        bet, check, call, fold = np.asarray(final['player2_strategy'])[:, 2]
+        lines.append(f"  After P1 checks: bets {bet*100:.1f}%, checks {check*100:.1f}%")
+        lines.append(f"  After P1 bets: calls {call*100:.1f}%, folds {fold*100:.1f}%")
         
-        print("\n" + "=" * 60)
+        lines.append("\n" + "=" * 60)
     else:
-        print("\nNo equilibrium found within iteration limit.")
-        print("Try increasing max_iterations or adjusting starting strategies.")
+        lines.append("\nNo equilibrium found within iteration limit.")
+        lines.append("Try increasing max_iterations or adjusting starting strategies.")
+    print("\n".join(lines))
     
     return results
 
 
-def compare_strategies():
+def compare_strategies(warm_start=None):
     """
     Compare different starting strategies and their convergence.
+    
+    Args:
+        warm_start: Optional (player1_strategy, player2_strategy) pair, e.g.
+            the last equilibrium of an earlier run, compared as a third start
     """
     print("\n" + "=" * 60)
     print("Comparing Different Starting Strategies")
     print("=" * 60)
     
-    solver = EquilibriumSolver(n=5)
+    solver = _get_solver(5)
     
     # Strategy 1: Default
-    print("\n\n### Running with default strategy...")
     p1_default, p2_default = solver.strategy_mgr.initialize_default_strategy()
-    results_default = solver.solve(
-        p1_default, p2_default,
-        max_iterations=1000,
-        check_frequency=500
-    )
     
-    # Strategy 2: More aggressive
-    print("\n\n### Running with aggressive strategy...")
-    p1_aggressive, p2_aggressive = solver.strategy_mgr.initialize_default_strategy()
-    # Increase betting frequencies
-    for card in range(5):
-        if card > 0:  # Don't change card 1
-            p1_aggressive.iloc[0, card] = min(1.0, p1_aggressive.iloc[0, card] + 0.2)
-            p1_aggressive.iloc[1, card] = 1.0 - p1_aggressive.iloc[0, card]
-    
-    results_aggressive = solver.solve(
-        p1_aggressive, p2_aggressive,
+    # Strategy 2: More aggressive (a modified copy of the default)
+    p1_aggressive, p2_aggressive = p1_default.copy(), p2_default.copy()
+    # Increase betting frequencies for every card except card 1
+    bet = p1_aggressive[0, 1:]
+    np.minimum(bet + 0.2, 1.0, out=bet)
+    p1_aggressive[1, 1:] = 1.0 - bet
+    
+    names = ["Default", "Aggressive"]
+    p1_starts = [p1_default, p1_aggressive]
+    p2_starts = [p2_default, p2_aggressive]
+    
+    # Strategy 3: Warm start from a previously found equilibrium
+    if warm_start is not None:
+        names.append("Warm Start")
+        p1_starts.append(np.asarray(warm_start[0], dtype=np.float64))
+        p2_starts.append(np.asarray(warm_start[1], dtype=np.float64))
+    
+    # Run all starts together as one batch
+    print(f"\n\n### Running with {', '.join(names).lower()} strategies...")
+    all_results = solver.solve_batch(
+        np.stack(p1_starts),
+        np.stack(p2_starts),
         max_iterations=1000,
         check_frequency=500
     )
@@ -206,19 +234,16 @@ def compare_strategies():
     print("COMPARISON RESULTS")
     print("=" * 60)
     
-    if results_default:
-        final_default = results_default[-1]
-        print(f"\nDefault Strategy:")
-        print(f"  Iterations to converge: {final_default['iteration']}")
-        print(f"  Player 1 EV: {final_default['ev_player1']:.6f}")
-        print(f"  Player 2 EV: {final_default['ev_player2']:.6f}")
-    
-    if results_aggressive:
-        final_aggressive = results_aggressive[-1]
-        print(f"\nAggressive Strategy:")
-        print(f"  Iterations to converge: {final_aggressive['iteration']}")
-        print(f"  Player 1 EV: {final_aggressive['ev_player1']:.6f}")
-        print(f"  Player 2 EV: {final_aggressive['ev_player2']:.6f}")
+    for name, results in zip(names, all_results):
+        print(f"\n{name} Strategy:")
+        if results:
+            final = results[-1]
+            print(f"  First equilibrium at iteration: {results[0]['iteration']}")
+            print(f"  Iterations to converge: {final['iteration']}")
+            print(f"  Player 1 EV: {final['ev_player1']:.6f}")
+            print(f"  Player 2 EV: {final['ev_player2']:.6f}")
+        else:
+            print("  No equilibrium found")
     
     print("\nNote: Different starting strategies should converge to")
     print("similar equilibrium EVs, though the exact strategies may vary")
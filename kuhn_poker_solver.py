@@ -6,10 +6,39 @@ This implements an iterative algorithm to approximate Nash equilibrium
 strategies for 5-card Kuhn Poker through self-play.
 """
 
+import contextlib
+import io
 import numpy as np
 import pandas as pd
-from typing import Tuple, List, Dict, Any
-import copy
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, List, Dict, Any, Optional
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the kernels below also run as plain Python
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Row labels of the strategy matrices (used for display only)
+PLAYER_1_ACTIONS = ['P(Check 1)', 'P(Bet)', 'P(Fold 1)', 'P(Fold 2)', 'P(Call)']
+PLAYER_2_ACTIONS = ['P(Bet/Check)', 'P(Check/Fold)', 'P(Call)', 'P(Fold)']
+
+# run_game action codes (action_1a, action_1b, action_2a, action_2b) of every
+# terminal sequence; 0 marks an action that is not reached
+TERMINAL_SEQUENCES = {
+    'bet_call': (1, 0, 0, 2),
+    'bet_fold': (1, 0, 0, 3),
+    'check_bet_call': (2, 2, 1, 0),
+    'check_bet_fold': (2, 3, 1, 0),
+    'check_check': (2, 0, 2, 0),
+}
 
 
 class KuhnPokerEngine:
@@ -26,6 +55,26 @@ class KuhnPokerEngine:
             n: Number of cards in the deck (default 5 for 5-card Kuhn)
         """
         self.n = n
+        self.payoffs = self._build_payoffs()
+        
+    def _build_payoffs(self) -> Dict[str, np.ndarray]:
+        """
+        Tabulate Player 1's payoff for every terminal sequence and pair of cards.
+        
+        Returns:
+            Dict mapping each TERMINAL_SEQUENCES name to an n x n matrix
+            (rows: Player 1's card, columns: Player 2's card). Entries for
+            equal cards, which cannot be dealt, are 0.
+        """
+        payoffs = {}
+        for name, actions in TERMINAL_SEQUENCES.items():
+            table = np.zeros((self.n, self.n))
+            for hand_1 in range(self.n):
+                for hand_2 in range(self.n):
+                    if hand_1 != hand_2:
+                        table[hand_1, hand_2], _ = self.run_game(*actions, hand_1 + 1, hand_2 + 1)
+            payoffs[name] = table
+        return payoffs
         
     def player_1_action(self, action: int, stack_1: float, pot: float, 
                        iteration: int) -> Tuple[float, float]:
@@ -119,36 +168,57 @@ class KuhnPokerEngine:
         Returns:
             Tuple of (stack_1, stack_2) - net payoffs for each player
         """
+        # Same rules as player_1_action, player_2_action and showdown,
+        # written inline so a game costs no helper calls
         stack_1, stack_2 = 0.0, 0.0
         pot = 0.0
         
-        # Player 1's first action
-        stack_1, pot = self.player_1_action(action_1a, stack_1, pot, 1)
+        # Player 1's first action: ante, plus 1 more on a bet
+        stack_1 -= 1.0
+        pot += 1.0
+        if action_1a == 1:
+            stack_1 -= 1.0
+            pot += 1.0
         
         if action_1a == 3:  # P1 folds (shouldn't happen in first node but included for completeness)
             stack_2 += pot
         elif action_1a == 2:  # P1 checks
-            # Player 2's turn in left node
-            stack_2, pot = self.player_2_action(action_2a, stack_2, pot, 1)
+            # Player 2's turn in left node: ante, plus 1 more on a bet
+            stack_2 -= 1.0
+            pot += 1.0
             
             if action_2a == 1:  # P2 bets after P1 checks
-                # Player 1's second action (call or fold)
-                stack_1, pot = self.player_1_action(action_1b, stack_1, pot, 2)
+                stack_2 -= 1.0
+                pot += 1.0
                 
                 if action_1b == 2:  # P1 calls
-                    stack_1, stack_2 = self.showdown(stack_1, stack_2, hand_1, hand_2, pot)
+                    stack_1 -= 1.0
+                    pot += 1.0
+                    if hand_1 > hand_2:
+                        stack_1 += pot
+                    else:
+                        stack_2 += pot
                 elif action_1b == 3:  # P1 folds
                     stack_2 += pot
             elif action_2a == 2:  # P2 checks
                 # Both check, go to showdown
-                stack_1, stack_2 = self.showdown(stack_1, stack_2, hand_1, hand_2, pot)
+                if hand_1 > hand_2:
+                    stack_1 += pot
+                else:
+                    stack_2 += pot
                 
         elif action_1a == 1:  # P1 bets
-            # Player 2's turn in right node
-            stack_2, pot = self.player_2_action(action_2b, stack_2, pot, 2)
+            # Player 2's turn in right node: ante, plus 1 more on a call
+            stack_2 -= 1.0
+            pot += 1.0
             
             if action_2b == 2:  # P2 calls
-                stack_1, stack_2 = self.showdown(stack_1, stack_2, hand_1, hand_2, pot)
+                stack_2 -= 1.0
+                pot += 1.0
+                if hand_1 > hand_2:
+                    stack_1 += pot
+                else:
+                    stack_2 += pot
             elif action_2b == 3:  # P2 folds
                 stack_1 += pot
                 
@@ -161,41 +231,53 @@ class StrategyManager:
     Strategy matrix format:
     - Player 1: 5 rows (Check1, Bet, Fold1, Fold2, Call) x n columns (cards)
     - Player 2: 4 rows (Bet/Check, Check/Fold, Call, Fold) x n columns (cards)
+    
+    Strategies are stored as plain NumPy arrays; labels are only attached
+    when a matrix is converted to a DataFrame for display. The solver keeps
+    them in C order, so each action's probabilities form a contiguous row.
     """
     
-    def __init__(self, n: int = 5):
+    def __init__(self, n: int = 5, dtype: np.dtype = np.float64):
         """
         Initialize strategy manager.
         
         Args:
             n: Number of cards in deck
+            dtype: Floating point type of the strategy matrices
         """
         self.n = n
+        self.dtype = dtype
         
-    def create_strategy_matrix(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def create_strategy_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Create empty strategy matrices for both players.
         
         Returns:
-            Tuple of (player1_strategy, player2_strategy) as DataFrames
+            Tuple of (player1_strategy, player2_strategy) as arrays
         """
-        # Player 1 strategy matrix
-        strategy_1 = pd.DataFrame(
-            np.zeros((5, self.n)),
-            index=['P(Check 1)', 'P(Bet)', 'P(Fold 1)', 'P(Fold 2)', 'P(Call)'],
-            columns=[f'Card_{i+1}' for i in range(self.n)]
-        )
+        strategy_1 = np.zeros((len(PLAYER_1_ACTIONS), self.n), dtype=self.dtype)
+        strategy_2 = np.zeros((len(PLAYER_2_ACTIONS), self.n), dtype=self.dtype)
+        
+        return strategy_1, strategy_2
+    
+    def to_dataframe(self, strategy: np.ndarray, player: int) -> pd.DataFrame:
+        """
+        Wrap a strategy matrix in a labelled DataFrame for display.
         
-        # Player 2 strategy matrix
-        strategy_2 = pd.DataFrame(
-            np.zeros((4, self.n)),
-            index=['P(Bet/Check)', 'P(Check/Fold)', 'P(Call)', 'P(Fold)'],
+        Args:
+            strategy: Strategy matrix for the given player
+            player: 1 or 2
+            
+        Returns:
+            DataFrame with action rows and card columns
+        """
+        return pd.DataFrame(
+            strategy,
+            index=PLAYER_1_ACTIONS if player == 1 else PLAYER_2_ACTIONS,
             columns=[f'Card_{i+1}' for i in range(self.n)]
         )
-        
-        return strategy_1, strategy_2
     
-    def initialize_default_strategy(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def initialize_default_strategy(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Initialize with default starting strategies based on the thesis.
         
@@ -206,79 +288,79 @@ class StrategyManager:
         
         # Player 1 fixed strategies
         # Always call with highest card
-        p1_strat.iloc[4, self.n-1] = 1.0  # Call with 5
-        p1_strat.iloc[3, self.n-1] = 0.0  # Don't fold with 5
+        p1_strat[4, self.n-1] = 1.0  # Call with 5
+        p1_strat[3, self.n-1] = 0.0  # Don't fold with 5
         
         # Never call with lowest card
-        p1_strat.iloc[4, 0] = 0.0  # Don't call with 1
-        p1_strat.iloc[3, 0] = 1.0  # Always fold with 1
+        p1_strat[4, 0] = 0.0  # Don't call with 1
+        p1_strat[3, 0] = 1.0  # Always fold with 1
         
         # Turn off folding in first node
-        p1_strat.iloc[2, :] = 0.0
+        p1_strat[2, :] = 0.0
         
         # Initial guesses for middle cards
-        p1_strat.iloc[1, self.n-1] = 0.0  # Check probability with 5
-        p1_strat.iloc[0, self.n-1] = 1.0  # Bet probability with 5
+        p1_strat[1, self.n-1] = 0.0  # Check probability with 5
+        p1_strat[0, self.n-1] = 1.0  # Bet probability with 5
         
-        p1_strat.iloc[1, self.n-2] = 0.0  # Check with 4
-        p1_strat.iloc[0, self.n-2] = 1.0  # Bet with 4
+        p1_strat[1, self.n-2] = 0.0  # Check with 4
+        p1_strat[0, self.n-2] = 1.0  # Bet with 4
         
-        p1_strat.iloc[1, 2] = 0.49  # Check with 3
-        p1_strat.iloc[0, 2] = 0.51  # Bet with 3
+        p1_strat[1, 2] = 0.49  # Check with 3
+        p1_strat[0, 2] = 0.51  # Bet with 3
         
-        p1_strat.iloc[1, 1] = 0.31  # Check with 2
-        p1_strat.iloc[0, 1] = 0.69  # Bet with 2
+        p1_strat[1, 1] = 0.31  # Check with 2
+        p1_strat[0, 1] = 0.69  # Bet with 2
         
-        p1_strat.iloc[1, 0] = 1.0  # Check with 1 (bluff less initially)
-        p1_strat.iloc[0, 0] = 0.0  # Don't always bet with 1
+        p1_strat[1, 0] = 1.0  # Check with 1 (bluff less initially)
+        p1_strat[0, 0] = 0.0  # Don't always bet with 1
         
         # Call probabilities for middle cards
-        p1_strat.iloc[4, 3] = 0.95  # Call with 4
-        p1_strat.iloc[3, 3] = 0.05
+        p1_strat[4, 3] = 0.95  # Call with 4
+        p1_strat[3, 3] = 0.05
         
-        p1_strat.iloc[4, 2] = 0.49  # Call with 3
-        p1_strat.iloc[3, 2] = 0.51
+        p1_strat[4, 2] = 0.49  # Call with 3
+        p1_strat[3, 2] = 0.51
         
-        p1_strat.iloc[4, 1] = 0.09  # Call with 2
-        p1_strat.iloc[3, 1] = 0.91
+        p1_strat[4, 1] = 0.09  # Call with 2
+        p1_strat[3, 1] = 0.91
         
         # Player 2 fixed strategies
         # Always bet/call with highest card
-        p2_strat.iloc[1, self.n-1] = 1.0  # Bet with 5
-        p2_strat.iloc[0, self.n-1] = 0.0  # Don't check with 5
-        p2_strat.iloc[2, self.n-1] = 1.0  # Call with 5
-        p2_strat.iloc[3, self.n-1] = 0.0  # Don't fold with 5
+        p2_strat[1, self.n-1] = 1.0  # Bet with 5
+        p2_strat[0, self.n-1] = 0.0  # Don't check with 5
+        p2_strat[2, self.n-1] = 1.0  # Call with 5
+        p2_strat[3, self.n-1] = 0.0  # Don't fold with 5
         
         # Always fold with lowest card
-        p2_strat.iloc[2, 0] = 0.0  # Don't call with 1
-        p2_strat.iloc[3, 0] = 1.0  # Fold with 1
+        p2_strat[2, 0] = 0.0  # Don't call with 1
+        p2_strat[3, 0] = 1.0  # Fold with 1
         
         # Initial guesses
-        p2_strat.iloc[1, 3] = 0.91  # Bet with 4
-        p2_strat.iloc[0, 3] = 0.09  # Check with 4
+        p2_strat[1, 3] = 0.91  # Bet with 4
+        p2_strat[0, 3] = 0.09  # Check with 4
         
-        p2_strat.iloc[1, 2] = 0.61  # Bet with 3
-        p2_strat.iloc[0, 2] = 0.39
+        p2_strat[1, 2] = 0.61  # Bet with 3
+        p2_strat[0, 2] = 0.39
         
-        p2_strat.iloc[1, 1] = 0.21  # Bet with 2
-        p2_strat.iloc[0, 1] = 0.79
+        p2_strat[1, 1] = 0.21  # Bet with 2
+        p2_strat[0, 1] = 0.79
         
-        p2_strat.iloc[1, 0] = 0.81  # Bluff with 1
-        p2_strat.iloc[0, 0] = 0.19
+        p2_strat[1, 0] = 0.81  # Bluff with 1
+        p2_strat[0, 0] = 0.19
         
         # Call probabilities
-        p2_strat.iloc[3, 3] = 0.11  # Fold with 4
-        p2_strat.iloc[2, 3] = 0.89  # Call with 4
+        p2_strat[3, 3] = 0.11  # Fold with 4
+        p2_strat[2, 3] = 0.89  # Call with 4
         
-        p2_strat.iloc[3, 2] = 0.51  # Fold with 3
-        p2_strat.iloc[2, 2] = 0.49  # Call with 3
+        p2_strat[3, 2] = 0.51  # Fold with 3
+        p2_strat[2, 2] = 0.49  # Call with 3
         
-        p2_strat.iloc[3, 1] = 0.79  # Fold with 2
-        p2_strat.iloc[2, 1] = 0.21  # Call with 2
+        p2_strat[3, 1] = 0.79  # Fold with 2
+        p2_strat[2, 1] = 0.21  # Call with 2
         
         return p1_strat, p2_strat
     
-    def initialize_random_strategy(self, seed: int = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def initialize_random_strategy(self, seed: int = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Initialize with random starting strategies.
         
@@ -298,60 +380,471 @@ class StrategyManager:
             # First node: Bet vs Check (rows 0 and 1)
             if card == 0:
                 # Card 1: Bias toward checking (weak card)
-                p1_strat.iloc[0, card] = np.random.uniform(0.0, 0.5)  # Bet less often
+                p1_strat[0, card] = np.random.uniform(0.0, 0.5)  # Bet less often
             elif card == self.n - 1:
                 # Card 5: Bias toward betting (strong card)
-                p1_strat.iloc[0, card] = np.random.uniform(0.5, 1.0)  # Bet more often
+                p1_strat[0, card] = np.random.uniform(0.5, 1.0)  # Bet more often
             else:
                 # Middle cards: Random
-                p1_strat.iloc[0, card] = np.random.uniform(0.0, 1.0)
+                p1_strat[0, card] = np.random.uniform(0.0, 1.0)
             
-            p1_strat.iloc[1, card] = 1.0 - p1_strat.iloc[0, card]  # Complement
+            p1_strat[1, card] = 1.0 - p1_strat[0, card]  # Complement
             
             # No folding in first node
-            p1_strat.iloc[2, card] = 0.0
+            p1_strat[2, card] = 0.0
             
             # Second node: Call vs Fold (rows 3 and 4)
             if card == 0:
                 # Card 1: Always fold
-                p1_strat.iloc[3, card] = 1.0
-                p1_strat.iloc[4, card] = 0.0
+                p1_strat[3, card] = 1.0
+                p1_strat[4, card] = 0.0
             elif card == self.n - 1:
                 # Card 5: Always call
-                p1_strat.iloc[3, card] = 0.0
-                p1_strat.iloc[4, card] = 1.0
+                p1_strat[3, card] = 0.0
+                p1_strat[4, card] = 1.0
             else:
                 # Middle cards: Random call frequency
-                p1_strat.iloc[4, card] = np.random.uniform(0.0, 1.0)
-                p1_strat.iloc[3, card] = 1.0 - p1_strat.iloc[4, card]
+                p1_strat[4, card] = np.random.uniform(0.0, 1.0)
+                p1_strat[3, card] = 1.0 - p1_strat[4, card]
         
         # Player 2 random strategies with constraints
         for card in range(self.n):
             # Left node: Bet vs Check (rows 0 and 1)
             if card == self.n - 1:
                 # Card 5: Always bet
-                p2_strat.iloc[0, card] = 1.0
-                p2_strat.iloc[1, card] = 0.0
+                p2_strat[0, card] = 1.0
+                p2_strat[1, card] = 0.0
             else:
                 # Other cards: Random
-                p2_strat.iloc[0, card] = np.random.uniform(0.0, 1.0)
-                p2_strat.iloc[1, card] = 1.0 - p2_strat.iloc[0, card]
+                p2_strat[0, card] = np.random.uniform(0.0, 1.0)
+                p2_strat[1, card] = 1.0 - p2_strat[0, card]
             
             # Right node: Call vs Fold (rows 2 and 3)
             if card == 0:
                 # Card 1: Always fold
-                p2_strat.iloc[2, card] = 0.0
-                p2_strat.iloc[3, card] = 1.0
+                p2_strat[2, card] = 0.0
+                p2_strat[3, card] = 1.0
             elif card == self.n - 1:
                 # Card 5: Always call
-                p2_strat.iloc[2, card] = 1.0
-                p2_strat.iloc[3, card] = 0.0
+                p2_strat[2, card] = 1.0
+                p2_strat[3, card] = 0.0
             else:
                 # Middle cards: Random call frequency
-                p2_strat.iloc[2, card] = np.random.uniform(0.0, 1.0)
-                p2_strat.iloc[3, card] = 1.0 - p2_strat.iloc[2, card]
+                p2_strat[2, card] = np.random.uniform(0.0, 1.0)
+                p2_strat[3, card] = 1.0 - p2_strat[2, card]
         
         return p1_strat, p2_strat
+    
+    def perturb_strategy(self, p1_strat: np.ndarray, p2_strat: np.ndarray,
+                         noise: float = 0.05, seed: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Add uniform noise to the free probabilities of a pair of strategies.
+        
+        The same probabilities as in initialize_random_strategy are perturbed;
+        the fixed ones (e.g. always calling with card 5) are left alone, and
+        each complementary row is recomputed so every decision still sums to 1.
+        
+        Args:
+            p1_strat: Player 1 strategy to perturb (not modified)
+            p2_strat: Player 2 strategy to perturb (not modified)
+            noise: Half-width of the uniform noise added to each probability
+            seed: Random seed for reproducibility (optional)
+            
+        Returns:
+            Tuple of perturbed strategy matrices
+        """
+        rng = np.random.default_rng(seed)
+        p1_strat = np.array(p1_strat, dtype=self.dtype)
+        p2_strat = np.array(p2_strat, dtype=self.dtype)
+        middle = slice(1, self.n - 1)
+        
+        def jitter(values):
+            return np.clip(values + rng.uniform(-noise, noise, values.shape), 0.0, 1.0)
+        
+        # Player 1: Bet vs Check for every card, Call vs Fold for middle cards
+        p1_strat[0] = jitter(p1_strat[0])
+        p1_strat[1] = 1.0 - p1_strat[0]
+        p1_strat[4, middle] = jitter(p1_strat[4, middle])
+        p1_strat[3, middle] = 1.0 - p1_strat[4, middle]
+        
+        # Player 2: Bet vs Check except with card 5, Call vs Fold for middle cards
+        p2_strat[0, :-1] = jitter(p2_strat[0, :-1])
+        p2_strat[1, :-1] = 1.0 - p2_strat[0, :-1]
+        p2_strat[2, middle] = jitter(p2_strat[2, middle])
+        p2_strat[3, middle] = 1.0 - p2_strat[2, middle]
+        
+        return p1_strat, p2_strat
+
+
+@njit(cache=True)
+def _expected_value_loop(strategy_1, strategy_2, showdown):
+    """
+    Array kernel behind EVCalculator.calculate_ev, used when numba is installed.
+    
+    Terminal payoffs are the ones tabulated in KuhnPokerEngine.payoffs,
+    written out in terms of the showdown matrix so the kernel can be
+    compiled by numba.
+    
+    Args:
+        strategy_1: Player 1's strategy matrix
+        strategy_2: Player 2's strategy matrix
+        showdown: n x n matrix, +1 where Player 1's card wins, -1 where it loses
+        
+    Returns:
+        Tuple of (ev_player1, ev_player2)
+    """
+    n = showdown.shape[0]
+    ev_1 = 0.0
+    
+    for hand_1_idx in range(n):
+        for hand_2_idx in range(n):
+            if hand_1_idx == hand_2_idx:  # Can't have same card
+                continue
+            
+            # Probability of this hand combination
+            prob_hands = 1.0 / (n * (n - 1))
+            
+            # Showdowns are won by the higher card
+            winner = showdown[hand_1_idx, hand_2_idx]
+            
+            # P1 bets, P2 calls: pot of 4 goes to the winner
+            prob_1_bet = strategy_1[0, hand_1_idx]
+            prob_both_bet_call = prob_1_bet * strategy_2[2, hand_2_idx]
+            if prob_both_bet_call > 0:
+                stack_1 = 2.0 * winner
+                ev_1 += prob_hands * prob_both_bet_call * stack_1
+            
+            # P1 bets, P2 folds: P1 wins P2's ante
+            prob_bet_fold = prob_1_bet * strategy_2[3, hand_2_idx]
+            if prob_bet_fold > 0:
+                ev_1 += prob_hands * prob_bet_fold * 1.0
+            
+            # P1 checks, P2 bets
+            prob_1_check = strategy_1[1, hand_1_idx]
+            prob_check_bet = prob_1_check * strategy_2[0, hand_2_idx]
+            
+            if prob_check_bet > 0:
+                # P1 calls: pot of 4 goes to the winner
+                prob_check_bet_call = prob_check_bet * strategy_1[4, hand_1_idx]
+                if prob_check_bet_call > 0:
+                    stack_1 = 2.0 * winner
+                    ev_1 += prob_hands * prob_check_bet_call * stack_1
+                
+                # P1 folds: P2 wins P1's ante
+                prob_check_bet_fold = prob_check_bet * strategy_1[3, hand_1_idx]
+                if prob_check_bet_fold > 0:
+                    ev_1 += prob_hands * prob_check_bet_fold * -1.0
+            
+            # Both check: antes go to the winner
+            prob_both_check = prob_1_check * strategy_2[1, hand_2_idx]
+            if prob_both_check > 0:
+                ev_1 += prob_hands * prob_both_check * winner
+    
+    # Zero-sum game: Player 2's EV is the negation of Player 1's
+    return ev_1, -ev_1
+
+
+def _expected_value_vectorized(strategy_1, strategy_2, showdown):
+    """
+    Vectorized equivalent of _expected_value_loop, used for large decks without numba.
+    
+    Every terminal payoff is a bilinear form over the two players' action
+    vectors, so the sum over all card pairs reduces to a few matrix-vector
+    products: showdowns go through the showdown matrix, and pots won by a
+    fold only need the distinct-card sum (sum(a) * sum(b) - a . b).
+    
+    The strategies may carry leading batch dimensions, e.g. (K, 5, n) for
+    Player 1 against a single (4, n) Player 2; they broadcast against each
+    other and the EVs come back with the broadcast batch shape.
+    """
+    n = showdown.shape[0]
+    prob_hands = 1.0 / (n * (n - 1))
+    
+    bet_1, check_1 = strategy_1[..., 0, :], strategy_1[..., 1, :]
+    fold_1, call_1 = strategy_1[..., 3, :], strategy_1[..., 4, :]
+    bet_2, fold_2 = strategy_2[..., 0, :], strategy_2[..., 3, :]
+    
+    def dot(a, b):
+        return (a * b).sum(axis=-1)
+    
+    # Rows: showdown value of P2's bet, check and call against each P1 card
+    vs_2 = strategy_2[..., :3, :] @ showdown.T
+    
+    # Showdowns: bet/call and check/bet/call win 2, check/check wins 1
+    ev_showdown = (2.0 * (dot(bet_1, vs_2[..., 2, :]) + dot(check_1 * call_1, vs_2[..., 0, :]))
+                   + dot(check_1, vs_2[..., 1, :]))
+    # Folds: P1 wins 1 when P2 folds to a bet, loses 1 when folding to one
+    check_fold_1 = check_1 * fold_1
+    ev_fold = (bet_1.sum(axis=-1) * fold_2.sum(axis=-1) - dot(bet_1, fold_2)
+               - check_fold_1.sum(axis=-1) * bet_2.sum(axis=-1) + dot(check_fold_1, bet_2))
+    
+    ev_1 = prob_hands * (ev_showdown + ev_fold)
+    return ev_1, -ev_1
+
+
+# Largest deck for which _expected_value_unrolled generates code (n * (n - 1) pairs)
+MAX_UNROLLED_CARDS = 10
+
+_unrolled_kernels = {}
+
+
+def _generate_unrolled_kernel(n: int):
+    """
+    Generate an EV function for an n-card deck with every card pair written out.
+    
+    The showdown sign of each pair is known from the card order, so the
+    generated code is straight-line arithmetic on Python floats, with no
+    loops, branches or array operations.
+    
+    Args:
+        n: Number of cards in deck
+        
+    Returns:
+        Function of (strategy_1, strategy_2) returning (ev_player1, ev_player2)
+    """
+    lines = [
+        "def _expected_value_unrolled_n(strategy_1, strategy_2):",
+        "    bet_1, check_1 = strategy_1[0].tolist(), strategy_1[1].tolist()",
+        "    fold_1, call_1 = strategy_1[3].tolist(), strategy_1[4].tolist()",
+        "    bet_2, check_2 = strategy_2[0].tolist(), strategy_2[1].tolist()",
+        "    call_2, fold_2 = strategy_2[2].tolist(), strategy_2[3].tolist()",
+        "    total = 0.0",
+    ]
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            # Showdowns (bet/call, check/bet/call pay 2, check/check pays 1) go
+            # to the higher card; folds pay the ante
+            sign = "+" if i > j else "-"
+            lines.append(
+                f"    total {sign}= 2.0 * (bet_1[{i}] * call_2[{j}] + check_1[{i}] * call_1[{i}] * bet_2[{j}])"
+                f" + check_1[{i}] * check_2[{j}]"
+            )
+            lines.append(
+                f"    total += bet_1[{i}] * fold_2[{j}] - check_1[{i}] * fold_1[{i}] * bet_2[{j}]"
+            )
+    lines.append(f"    ev_1 = total / {n * (n - 1)}")
+    lines.append("    return ev_1, -ev_1")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_expected_value_unrolled_n"]
+
+
+def _expected_value_unrolled(strategy_1, strategy_2, showdown):
+    """
+    Equivalent of _expected_value_loop using code generated for the deck size.
+    
+    Used without numba: for small decks the generated straight-line code
+    beats the NumPy version, whose cost is dominated by per-call overhead.
+    Larger decks fall back to _expected_value_vectorized.
+    """
+    n = showdown.shape[0]
+    if n > MAX_UNROLLED_CARDS:
+        return _expected_value_vectorized(strategy_1, strategy_2, showdown)
+    kernel = _unrolled_kernels.get(n)
+    if kernel is None:
+        kernel = _unrolled_kernels[n] = _generate_unrolled_kernel(n)
+    return kernel(strategy_1, strategy_2)
+
+
+# Without numba the loop kernel would run interpreted, so use generated code instead
+_expected_value = _expected_value_loop if NUMBA_AVAILABLE else _expected_value_unrolled
+
+
+@njit(cache=True)
+def _line_endpoints(strategy_update, strategy_fixed, row1, column, row2, player, showdown):
+    """
+    EV of the updating player with the probability at (row1, column) set to 0 and to 1.
+    
+    With row2 tied to 1 - row1 the EV is linear in that probability p, so
+    EV(p) = ev_zero + (ev_one - ev_zero) * p. The two cells are set in
+    place for the evaluations and restored afterwards.
+    
+    Returns:
+        Tuple of (ev_zero, ev_one)
+    """
+    prob = strategy_update[row1, column]
+    prob_other = strategy_update[row2, column]
+    
+    strategy_update[row1, column] = 1.0
+    strategy_update[row2, column] = 0.0
+    if player == 1:
+        ev_one, _ = _expected_value(strategy_update, strategy_fixed, showdown)
+    else:
+        _, ev_one = _expected_value(strategy_fixed, strategy_update, showdown)
+    strategy_update[row1, column] = 0.0
+    strategy_update[row2, column] = 1.0
+    if player == 1:
+        ev_zero, _ = _expected_value(strategy_update, strategy_fixed, showdown)
+    else:
+        _, ev_zero = _expected_value(strategy_fixed, strategy_update, showdown)
+    
+    strategy_update[row1, column] = prob
+    strategy_update[row2, column] = prob_other
+    return ev_zero, ev_one
+
+
+@njit(cache=True)
+def _update_probability(k, strategy_update, strategy_fixed, row1, column,
+                        row2, player, epsilon, showdown):
+    """
+    Array kernel behind ProbabilityUpdater.update_probability.
+    
+    Takes the same arguments (with the showdown matrix of _expected_value
+    in place of n) and returns the same (ev, strategy) tuple, except that
+    strategy_update is updated in place and returned rather than copied.
+    The EV is the updating player's EV for the returned strategy.
+    
+    The EV is linear along the updated probability (see _line_endpoints),
+    so the two endpoints are evaluated once and each step only costs a few
+    multiply-adds.
+    """
+    # Only (row1, column) and (row2, column) change; the search runs on them
+    prob = strategy_update[row1, column]
+    prob_other = strategy_update[row2, column]
+    
+    ev_zero, ev_one = _line_endpoints(strategy_update, strategy_fixed, row1, column,
+                                      row2, player, showdown)
+    slope = ev_one - ev_zero
+    
+    for _ in range(k):
+        # Calculate current EV
+        ev_initial = ev_zero + slope * prob
+        
+        # Try increasing probability
+        if prob + epsilon >= 1.0:
+            prob_increase = 1.0
+            other_increase = 0.0
+        else:
+            prob_increase = prob + epsilon
+            other_increase = 1.0 - prob_increase
+        
+        # Try decreasing probability
+        if prob - epsilon <= 0.0:
+            prob_decrease = 0.0
+            other_decrease = 1.0
+        else:
+            prob_decrease = prob - epsilon
+            other_decrease = 1.0 - prob_decrease
+        
+        # Calculate EVs for increased and decreased strategies
+        # (-inf when the probability is already pinned at that end)
+        if prob_increase == prob and prob_increase == 1.0:
+            ev_increase = -np.inf
+        else:
+            ev_increase = ev_zero + slope * prob_increase
+        
+        if prob_decrease == prob and prob_decrease == 0.0:
+            ev_decrease = -np.inf
+        else:
+            ev_decrease = ev_zero + slope * prob_decrease
+        
+        # Pick the best of staying, increasing and decreasing (argmax, first wins ties)
+        choice = 0
+        ev_best = ev_initial
+        if ev_increase > ev_best:
+            choice = 1
+            ev_best = ev_increase
+        if ev_decrease > ev_best:
+            choice = 2
+            ev_best = ev_decrease
+        
+        # Stop once neither direction improves the EV
+        if choice == 0:
+            break
+        elif choice == 1:
+            prob, prob_other = prob_increase, other_increase
+        else:
+            prob, prob_other = prob_decrease, other_decrease
+    
+    strategy_update[row1, column] = prob
+    strategy_update[row2, column] = prob_other
+    return ev_zero + slope * prob, strategy_update
+
+
+@njit(cache=True)
+def _best_response_cell(strategy_update, strategy_fixed, row1, column, row2, player, showdown):
+    """
+    Move the probability at (row1, column) to its best response, in place.
+    
+    The EV is linear in that probability, so the best response is 1 when
+    the EV increases with it, 0 when it decreases, and unchanged otherwise.
+    This is where a long _update_probability search ends up, in one step.
+    
+    Returns:
+        Tuple of (ev, strategy_update) like _update_probability
+    """
+    ev_zero, ev_one = _line_endpoints(strategy_update, strategy_fixed, row1, column,
+                                      row2, player, showdown)
+    if ev_one > ev_zero:
+        strategy_update[row1, column] = 1.0
+        strategy_update[row2, column] = 0.0
+        return ev_one, strategy_update
+    elif ev_zero > ev_one:
+        strategy_update[row1, column] = 0.0
+        strategy_update[row2, column] = 1.0
+    return ev_zero, strategy_update
+
+
+@njit(cache=True)
+def _self_play_iteration(p1, p2, epsilon, showdown):
+    """
+    Run one solver iteration: Player 1 stage 1, Player 2, then Player 1 stage 3.
+    
+    Args:
+        p1: Player 1's strategy matrix, updated in place
+        p2: Player 2's strategy matrix, updated in place
+        epsilon: Update step size
+        showdown: Showdown matrix (see _expected_value)
+        
+    Returns:
+        Tuple of updated (p1, p2), the same arrays that were passed in, and
+        Player 1's EV for them
+    """
+    n = showdown.shape[0]
+    
+    # Update Player 1 Stage 1 (first node probabilities)
+    for hand in range(n):
+        _, p1 = _update_probability(1, p1, p2, 0, hand, 1, 1, epsilon, showdown)
+    
+    # Update Player 2
+    for hand in range(4):  # Cards 1-4 (card 5 is fixed)
+        for action in (0, 2):  # Bet/Check and Call/Fold rows
+            if hand == 0 and action == 2:  # Don't update call with card 1
+                continue
+            _, p2 = _update_probability(1, p2, p1, action, hand,
+                                        action + 1, 2, epsilon, showdown)
+    
+    # Update Player 1 Stage 3 (call/fold probabilities); the last update
+    # also yields Player 1's EV for the final pair of strategies
+    ev_1 = 0.0
+    for hand in range(1, n - 1):  # Fold with cards 1 and 5 is fixed
+        ev_1, p1 = _update_probability(1, p1, p2, 3, hand, 4, 1, epsilon, showdown)
+    if n < 3:
+        ev_1, _ = _expected_value(p1, p2, showdown)
+    
+    return p1, p2, ev_1
+
+
+@njit(cache=True)
+def _self_play_batch(p1_batch, p2_batch, ev_1_batch, active, epsilon, showdown):
+    """
+    Run one solver iteration for every active pair in a batch of strategies.
+    
+    Args:
+        p1_batch: Player 1 strategies, shape (B, 5, n), updated in place
+        p2_batch: Player 2 strategies, shape (B, 4, n), updated in place
+        ev_1_batch: Length-B array, set to Player 1's EV for each updated pair
+        active: Boolean mask of length B; inactive pairs are left untouched
+        epsilon: Update step size
+        showdown: Showdown matrix (see _expected_value)
+    """
+    for b in range(p1_batch.shape[0]):
+        if active[b]:
+            _, _, ev_1_batch[b] = _self_play_iteration(p1_batch[b], p2_batch[b],
+                                                       epsilon, showdown)
 
 
 class EVCalculator:
@@ -359,18 +852,24 @@ class EVCalculator:
     Calculates expected value for each player given their strategies.
     """
     
-    def __init__(self, engine: KuhnPokerEngine):
+    def __init__(self, engine: KuhnPokerEngine, dtype: np.dtype = np.float64):
         """
         Initialize EV calculator.
         
         Args:
             engine: KuhnPokerEngine instance
+            dtype: Floating point type strategies are evaluated in
         """
         self.engine = engine
         self.n = engine.n
         
-    def calculate_ev(self, strategy_1: pd.DataFrame, 
-                    strategy_2: pd.DataFrame) -> Tuple[float, float]:
+        # Showdown outcome for every pair of cards (the check/check payoff):
+        # +1 where Player 1's card is higher, -1 where it is lower. The other
+        # terminal payoffs are multiples of this or of a constant ante.
+        self.showdown = engine.payoffs['check_check'].astype(dtype)
+        
+    def calculate_ev(self, strategy_1: np.ndarray, 
+                    strategy_2: np.ndarray) -> Tuple[float, float]:
         """
         Calculate expected value for both players given their strategies.
         
@@ -381,74 +880,32 @@ class EVCalculator:
         Returns:
             Tuple of (ev_player1, ev_player2)
         """
-        ev_1 = 0.0
-        ev_2 = 0.0
+        dtype = self.showdown.dtype
+        ev_1, ev_2 = _expected_value(np.ascontiguousarray(strategy_1, dtype=dtype),
+                                     np.ascontiguousarray(strategy_2, dtype=dtype),
+                                     self.showdown)
+        return float(ev_1), float(ev_2)
+    
+    def calculate_ev_batch(self, strategies_1: np.ndarray,
+                           strategies_2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate expected values for many strategy pairs in one call.
         
-        # Iterate through all possible card combinations
-        for hand_1 in range(1, self.n + 1):
-            for hand_2 in range(1, self.n + 1):
-                if hand_1 == hand_2:  # Can't have same card
-                    continue
-                
-                # Probability of this hand combination
-                prob_hands = 1.0 / (self.n * (self.n - 1))
-                
-                # Calculate EV for all action combinations
-                hand_1_idx = hand_1 - 1
-                hand_2_idx = hand_2 - 1
-                
-                # P1 bets (action_1a = 1)
-                prob_1_bet = strategy_1.iloc[0, hand_1_idx]
-                
-                # P2 calls
-                prob_2_call = strategy_2.iloc[2, hand_2_idx]
-                prob_both_bet_call = prob_1_bet * prob_2_call
-                if prob_both_bet_call > 0:
-                    stack_1, stack_2 = self.engine.run_game(1, 0, 0, 2, hand_1, hand_2)
-                    ev_1 += prob_hands * prob_both_bet_call * stack_1
-                    ev_2 += prob_hands * prob_both_bet_call * stack_2
-                
-                # P2 folds
-                prob_2_fold = strategy_2.iloc[3, hand_2_idx]
-                prob_bet_fold = prob_1_bet * prob_2_fold
-                if prob_bet_fold > 0:
-                    stack_1, stack_2 = self.engine.run_game(1, 0, 0, 3, hand_1, hand_2)
-                    ev_1 += prob_hands * prob_bet_fold * stack_1
-                    ev_2 += prob_hands * prob_bet_fold * stack_2
-                
-                # P1 checks (action_1a = 2)
-                prob_1_check = strategy_1.iloc[1, hand_1_idx]
-                
-                # P2 bets after P1 checks
-                prob_2_bet = strategy_2.iloc[0, hand_2_idx]
-                prob_check_bet = prob_1_check * prob_2_bet
-                
-                if prob_check_bet > 0:
-                    # P1 calls
-                    prob_1_call = strategy_1.iloc[4, hand_1_idx]
-                    prob_check_bet_call = prob_check_bet * prob_1_call
-                    if prob_check_bet_call > 0:
-                        stack_1, stack_2 = self.engine.run_game(2, 2, 1, 0, hand_1, hand_2)
-                        ev_1 += prob_hands * prob_check_bet_call * stack_1
-                        ev_2 += prob_hands * prob_check_bet_call * stack_2
-                    
-                    # P1 folds
-                    prob_1_fold = strategy_1.iloc[3, hand_1_idx]
-                    prob_check_bet_fold = prob_check_bet * prob_1_fold
-                    if prob_check_bet_fold > 0:
-                        stack_1, stack_2 = self.engine.run_game(2, 3, 1, 0, hand_1, hand_2)
-                        ev_1 += prob_hands * prob_check_bet_fold * stack_1
-                        ev_2 += prob_hands * prob_check_bet_fold * stack_2
-                
-                # P2 checks after P1 checks
-                prob_2_check = strategy_2.iloc[1, hand_2_idx]
-                prob_both_check = prob_1_check * prob_2_check
-                if prob_both_check > 0:
-                    stack_1, stack_2 = self.engine.run_game(2, 0, 2, 0, hand_1, hand_2)
-                    ev_1 += prob_hands * prob_both_check * stack_1
-                    ev_2 += prob_hands * prob_both_check * stack_2
+        The batch dimensions broadcast, so K Player 1 candidates can be scored
+        against one Player 2 strategy (or the other way round) without a loop.
         
-        return ev_1, ev_2
+        Args:
+            strategies_1: Player 1 strategies, shape (5, n) or (K, 5, n)
+            strategies_2: Player 2 strategies, shape (4, n) or (K, 4, n)
+            
+        Returns:
+            Tuple of (ev_player1, ev_player2) arrays with the broadcast batch
+            shape: (K,) if either input is batched, 0-d for two single strategies
+        """
+        dtype = self.showdown.dtype
+        return _expected_value_vectorized(np.asarray(strategies_1, dtype=dtype),
+                                          np.asarray(strategies_2, dtype=dtype),
+                                          self.showdown)
 
 
 class ProbabilityUpdater:
@@ -465,9 +922,9 @@ class ProbabilityUpdater:
         """
         self.ev_calc = ev_calculator
         
-    def update_probability(self, n: int, k: int, strategy_update: pd.DataFrame,
-                          strategy_fixed: pd.DataFrame, row1: int, column: int,
-                          row2: int, player: int, epsilon: float) -> Tuple[float, pd.DataFrame]:
+    def update_probability(self, n: int, k: int, strategy_update: np.ndarray,
+                          strategy_fixed: np.ndarray, row1: int, column: int,
+                          row2: int, player: int, epsilon: float) -> Tuple[float, np.ndarray]:
         """
         Update a single probability in the strategy matrix.
         
@@ -485,68 +942,12 @@ class ProbabilityUpdater:
         Returns:
             Tuple of (final_ev, updated_strategy)
         """
-        strategy_update = strategy_update.copy()
-        counter = 0
-        
-        for _ in range(k):
-            # Calculate current EV
-            if player == 1:
-                ev_initial, _ = self.ev_calc.calculate_ev(strategy_update, strategy_fixed)
-            else:
-                _, ev_initial = self.ev_calc.calculate_ev(strategy_fixed, strategy_update)
-            
-            # Try increasing probability
-            strategy_increase = strategy_update.copy()
-            if strategy_increase.iloc[row1, column] + epsilon >= 1.0:
-                strategy_increase.iloc[row1, column] = 1.0
-                strategy_increase.iloc[row2, column] = 0.0
-            else:
-                strategy_increase.iloc[row1, column] += epsilon
-                strategy_increase.iloc[row2, column] = 1.0 - strategy_increase.iloc[row1, column]
-            
-            # Try decreasing probability
-            strategy_decrease = strategy_update.copy()
-            if strategy_decrease.iloc[row1, column] - epsilon <= 0.0:
-                strategy_decrease.iloc[row1, column] = 0.0
-                strategy_decrease.iloc[row2, column] = 1.0
-            else:
-                strategy_decrease.iloc[row1, column] -= epsilon
-                strategy_decrease.iloc[row2, column] = 1.0 - strategy_decrease.iloc[row1, column]
-            
-            # Calculate EVs for increased and decreased strategies
-            if strategy_increase.iloc[row1, column] == strategy_update.iloc[row1, column] and \
-               strategy_increase.iloc[row1, column] == 1.0:
-                ev_increase = -9999
-            else:
-                if player == 1:
-                    ev_increase, _ = self.ev_calc.calculate_ev(strategy_increase, strategy_fixed)
-                else:
-                    _, ev_increase = self.ev_calc.calculate_ev(strategy_fixed, strategy_increase)
-            
-            if strategy_decrease.iloc[row1, column] == strategy_update.iloc[row1, column] and \
-               strategy_decrease.iloc[row1, column] == 0.0:
-                ev_decrease = -9999
-            else:
-                if player == 1:
-                    ev_decrease, _ = self.ev_calc.calculate_ev(strategy_decrease, strategy_fixed)
-                else:
-                    _, ev_decrease = self.ev_calc.calculate_ev(strategy_fixed, strategy_decrease)
-            
-            # Update strategy in direction of improvement
-            if ev_increase > ev_decrease and ev_increase > ev_initial:
-                strategy_update = strategy_increase
-            elif ev_decrease > ev_increase and ev_decrease > ev_initial:
-                strategy_update = strategy_decrease
-            
-            # Break if no improvement or reached max iterations
-            if counter == k:
-                break
-            elif ev_initial >= ev_increase and ev_initial >= ev_decrease:
-                break
-            
-            counter += 1
-        
-        return ev_initial, strategy_update
+        # The kernel works in place; copy so the caller's matrix is left as is
+        dtype = self.ev_calc.showdown.dtype
+        return _update_probability(k, np.array(strategy_update, dtype=dtype, order='C'),
+                                   np.ascontiguousarray(strategy_fixed, dtype=dtype),
+                                   row1, column, row2, player, epsilon,
+                                   self.ev_calc.showdown)
 
 
 class EquilibriumSolver:
@@ -554,22 +955,27 @@ class EquilibriumSolver:
     Main solver that uses self-play to find Nash equilibrium.
     """
     
-    def __init__(self, n: int = 5):
+    def __init__(self, n: int = 5, dtype: np.dtype = np.float64):
         """
         Initialize solver.
         
         Args:
             n: Number of cards in deck
+            dtype: Floating point type used for strategies (np.float64 or
+                np.float32); starting strategies are converted to it
         """
         self.n = n
+        self.dtype = dtype
         self.engine = KuhnPokerEngine(n)
-        self.ev_calc = EVCalculator(self.engine)
+        self.ev_calc = EVCalculator(self.engine, dtype)
         self.updater = ProbabilityUpdater(self.ev_calc)
-        self.strategy_mgr = StrategyManager(n)
+        self.strategy_mgr = StrategyManager(n, dtype)
         
-    def solve(self, p1_start: pd.DataFrame, p2_start: pd.DataFrame,
+    def solve(self, p1_start: np.ndarray, p2_start: np.ndarray,
              max_iterations: int = 10000, epsilon: float = 0.0001,
-             check_frequency: int = 100, max_equilibria: int = 3) -> List[Dict[str, Any]]:
+             check_frequency: int = 100, max_equilibria: int = 3,
+             max_check_frequency: Optional[int] = None,
+             verbose: bool = False) -> List[Dict[str, Any]]:
         """
         Run the equilibrium solver.
         
@@ -580,84 +986,70 @@ class EquilibriumSolver:
             max_equilibria: Maximum equilibria before stopping
             epsilon: Update step size
             check_frequency: How often to check for equilibrium
+            max_check_frequency: If given, the interval between checks doubles
+                (up to this cap) while the strategies keep drifting by more than
+                half the largest possible step (epsilon per iteration) between
+                checks, and drops back to check_frequency once they settle
+            verbose: Log every iteration and every check; by default only the
+                scheduled checks and equilibria found are reported
             
         Returns:
-            List of found equilibrium strategies
+            List of found equilibria (strategies as NumPy arrays)
         """
         output_list = []
-        p1_temp = p1_start.copy()
-        p2_temp = p2_start.copy()
+        p1_temp = np.array(p1_start, dtype=self.dtype, order='C')
+        p2_temp = np.array(p2_start, dtype=self.dtype, order='C')
         
         print("Initial Strategies")
         print("\nPlayer 1:")
-        print(p1_temp)
+        print(self.strategy_mgr.to_dataframe(p1_temp, 1))
         print("\nPlayer 2:")
-        print(p2_temp)
+        print(self.strategy_mgr.to_dataframe(p2_temp, 2))
         
         counter = 1
         equilibria_found = 0
+        check_interval = check_frequency
+        next_check = check_frequency
+        if max_check_frequency is not None:
+            p1_checked, p2_checked = p1_temp.copy(), p2_temp.copy()
         
         while counter <= max_iterations:
-            # Update Player 1 Stage 1 (first node probabilities)
-            print(f"\n=== Iteration {counter} ===")
-            print("Updating Player 1 Stage 1...")
-            
-            for hand in range(self.n):
-                action = 0  # Bet/Check row
-                # Skip certain fixed strategies
-                if hand == 0 and action == 3:  # Don't update fold with card 1
-                    continue
-                elif hand == self.n - 1 and action == 3:  # Don't update fold with card 5
-                    continue
-                else:
-                    alternate_row = action + 1
-                    ev_1, p1_temp = self.updater.update_probability(
-                        self.n, 1, p1_temp, p2_temp, action, hand, 
-                        alternate_row, 1, epsilon
-                    )
-            
-            # Update Player 2
-            print("Updating Player 2...")
-            for hand in range(4):  # Cards 1-4 (card 5 is fixed)
-                for action in [0, 2]:  # Bet/Check and Call/Fold rows
-                    if hand == 0 and action == 2:  # Don't update call with card 1
-                        continue
-                    else:
-                        alternate_row = action + 1
-                        ev_2, p2_temp = self.updater.update_probability(
-                            self.n, 1, p2_temp, p1_temp, action, hand,
-                            alternate_row, 2, epsilon
-                        )
-            
-            # Update Player 1 Stage 3 (call/fold probabilities)
-            print("Updating Player 1 Stage 3...")
-            for hand in range(self.n):
-                action = 3  # Fold row
-                if hand == 0 and action == 3:  # Don't update fold with card 1
-                    continue
-                elif hand == self.n - 1 and action == 3:  # Don't update fold with card 5
-                    continue
-                else:
-                    alternate_row = action + 1
-                    ev_1, p1_temp = self.updater.update_probability(
-                        self.n, 1, p1_temp, p2_temp, action, hand,
-                        alternate_row, 1, epsilon
-                    )
+            if verbose:
+                print(f"\n=== Iteration {counter} ===")
+            _, _, ev_1 = _self_play_iteration(p1_temp, p2_temp, epsilon, self.ev_calc.showdown)
             
             # Check for equilibrium periodically
-            if counter > 5000 or counter % check_frequency == 0:
-                print(f"\nChecking for equilibrium at iteration {counter}...")
-                ev_1, ev_2 = self.ev_calc.calculate_ev(p1_temp, p2_temp)
-                print(f"Current EVs: P1={ev_1:.6f}, P2={ev_2:.6f}")
+            if counter > 5000 or counter == next_check:
+                # Past 5000 iterations every iteration is checked; only log
+                # the scheduled checks unless verbose
+                report = verbose or counter == next_check
+                if counter == next_check:
+                    # Check less often while the strategies are still moving
+                    # steadily, and every check_frequency once they settle
+                    if max_check_frequency is not None:
+                        drift = max(np.abs(p1_temp - p1_checked).max(),
+                                    np.abs(p2_temp - p2_checked).max())
+                        if drift > 0.5 * epsilon * check_interval:
+                            check_interval = min(2 * check_interval, max_check_frequency)
+                        else:
+                            check_interval = check_frequency
+                        p1_checked[...] = p1_temp
+                        p2_checked[...] = p2_temp
+                    next_check += check_interval
+                ev_1, ev_2 = float(ev_1), -float(ev_1)  # From the last update (zero-sum)
+                if report:
+                    print(f"\nChecking for equilibrium at iteration {counter}...")
+                    print(f"Current EVs: P1={ev_1:.6f}, P2={ev_2:.6f}")
                 
-                is_equilibrium = self.check_equilibrium(p1_temp, p2_temp, ev_1, ev_2)
+                is_equilibrium = self.check_equilibrium(p1_temp, p2_temp, ev_1, ev_2,
+                                                        verbose=report)
                 
                 if is_equilibrium:
-                    print("\n*** EQUILIBRIUM FOUND ***")
+                    print(f"\n*** EQUILIBRIUM FOUND (iteration {counter}) ***")
                     print("\nPlayer 1 Strategy:")
-                    print(p1_temp)
+                    print(self.strategy_mgr.to_dataframe(p1_temp, 1))
                     print("\nPlayer 2 Strategy:")
-                    print(p2_temp)
+                    print(self.strategy_mgr.to_dataframe(p2_temp, 2))
                     print(f"\nEVs: P1={ev_1:.6f}, P2={ev_2:.6f}")
                     
                     output_list.append({
@@ -676,9 +1068,113 @@ class EquilibriumSolver:
         
         return output_list
     
-    def check_equilibrium(self, player1: pd.DataFrame, player2: pd.DataFrame,
+    def solve_batch(self, p1_starts: np.ndarray, p2_starts: np.ndarray,
+                    max_iterations: int = 10000, epsilon: float = 0.0001,
+                    check_frequency: int = 100, max_equilibria: int = 3,
+                    max_workers: Optional[int] = None,
+                    verbose: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Run the equilibrium solver from several starting strategies at once.
+        
+        All starts are advanced together, one compiled call per iteration.
+        A start stops being updated once it has found max_equilibria.
+        With max_workers > 1 the starts are split across worker processes,
+        each running its share as a smaller batch; their logs are collected
+        and printed in start order once all workers have finished.
+        
+        Args:
+            p1_starts: Player 1 starting strategies, shape (B, 5, n)
+            p2_starts: Player 2 starting strategies, shape (B, 4, n)
+            max_iterations: Maximum solver iterations
+            epsilon: Update step size
+            check_frequency: How often to check for equilibrium
+            max_equilibria: Maximum equilibria per start before it stops
+            max_workers: Number of worker processes (default: run in-process)
+            verbose: Log every check, not just those every check_frequency iterations
+            
+        Returns:
+            One results list per start, in the same format as solve()
+        """
+        p1_batch = np.array(p1_starts, dtype=self.dtype, order='C')
+        p2_batch = np.array(p2_starts, dtype=self.dtype, order='C')
+        batch_size = p1_batch.shape[0]
+        
+        settings = (max_iterations, epsilon, check_frequency, max_equilibria, verbose)
+        
+        if max_workers is not None and max_workers > 1 and batch_size > 1:
+            chunks = np.array_split(np.arange(batch_size), min(max_workers, batch_size))
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [
+                    executor.submit(_solve_batch_worker, self, p1_batch[chunk], p2_batch[chunk],
+                                    int(chunk[0]), settings)
+                    for chunk in chunks
+                ]
+                output_lists = []
+                for future in futures:
+                    results, log = future.result()
+                    print(log, end="")
+                    output_lists.extend(results)
+                return output_lists
+        
+        return self._run_batch(p1_batch, p2_batch, *settings)
+    
+    def _run_batch(self, p1_batch: np.ndarray, p2_batch: np.ndarray,
+                   max_iterations: int, epsilon: float, check_frequency: int,
+                   max_equilibria: int, verbose: bool,
+                   start_offset: int = 0) -> List[List[Dict[str, Any]]]:
+        """
+        In-process loop behind solve_batch, updating the batch in place.
+        
+        Args:
+            p1_batch: Player 1 strategies, shape (B, 5, n), C-contiguous
+            p2_batch: Player 2 strategies, shape (B, 4, n), C-contiguous
+            start_offset: Index of the first start in the full batch, used
+                to label the log when the batch is a worker's share
+            
+        Returns:
+            One results list per start, in the same format as solve()
+        """
+        batch_size = p1_batch.shape[0]
+        output_lists = [[] for _ in range(batch_size)]
+        active = np.ones(batch_size, dtype=np.bool_)
+        ev_1_batch = np.zeros(batch_size)
+        
+        counter = 1
+        while counter <= max_iterations and active.any():
+            _self_play_batch(p1_batch, p2_batch, ev_1_batch, active, epsilon,
+                             self.ev_calc.showdown)
+            
+            # Check for equilibrium periodically
+            if counter > 5000 or counter % check_frequency == 0:
+                report = verbose or counter % check_frequency == 0
+                for b in np.flatnonzero(active):
+                    ev_1 = float(ev_1_batch[b])  # From the last update (zero-sum)
+                    ev_2 = -ev_1
+                    if report:
+                        print(f"\nChecking start {start_offset + b} for equilibrium at iteration {counter}...")
+                        print(f"Current EVs: P1={ev_1:.6f}, P2={ev_2:.6f}")
+                    
+                    if self.check_equilibrium(p1_batch[b], p2_batch[b], ev_1, ev_2,
+                                              verbose=report):
+                        print(f"*** EQUILIBRIUM FOUND (start {start_offset + b}, iteration {counter}) ***")
+                        output_lists[b].append({
+                            'iteration': counter,
+                            'player1_strategy': p1_batch[b].copy(),
+                            'player2_strategy': p2_batch[b].copy(),
+                            'ev_player1': ev_1,
+                            'ev_player2': ev_2
+                        })
+                        
+                        if len(output_lists[b]) >= max_equilibria:
+                            active[b] = False
+            
+            counter += 1
+        
+        return output_lists
+    
+    def check_equilibrium(self, player1: np.ndarray, player2: np.ndarray,
                          ev_old_1: float, ev_old_2: float,
-                         epsilon_threshold: float = 0.01) -> bool:
+                         epsilon_threshold: float = 0.01, verbose: bool = True) -> bool:
         """
         Check if current strategies form an epsilon-Nash equilibrium.
         
@@ -688,11 +1184,16 @@ class EquilibriumSolver:
             ev_old_1: Player 1's EV with current strategies
             ev_old_2: Player 2's EV with current strategies
             epsilon_threshold: Maximum exploitability allowed
+            verbose: Print the exploitability of both players
             
         Returns:
             True if strategies form epsilon-equilibrium
         """
-        # Find best response for Player 1
+        player1 = np.ascontiguousarray(player1, dtype=self.dtype)
+        player2 = np.ascontiguousarray(player2, dtype=self.dtype)
+        
+        # Find best response for Player 1, one probability at a time; the
+        # last update also gives the EV of the full best response
         p1_best_response = player1.copy()
         for hand in range(self.n):
             for action in [0, 3]:  # Bet/Check and Fold rows
@@ -702,10 +1203,8 @@ class EquilibriumSolver:
                     continue
                 else:
                     alternate_row = action + 1
-                    _, p1_best_response = self.updater.update_probability(
-                        self.n, 9999, p1_best_response, player2, action, hand,
-                        alternate_row, 1, 0.01
-                    )
+                    ev_1_br, _ = _best_response_cell(p1_best_response, player2, action, hand,
+                                                     alternate_row, 1, self.ev_calc.showdown)
         
         # Find best response for Player 2
         p2_best_response = player2.copy()
@@ -715,28 +1214,65 @@ class EquilibriumSolver:
                     continue
                 else:
                     alternate_row = action + 1
-                    _, p2_best_response = self.updater.update_probability(
-                        self.n, 9999, p2_best_response, player1, action, hand,
-                        alternate_row, 2, 0.01
-                    )
-        
-        # Calculate EVs with best responses
-        ev_1_br, _ = self.ev_calc.calculate_ev(p1_best_response, player2)
-        _, ev_2_br = self.ev_calc.calculate_ev(player1, p2_best_response)
+                    ev_2_br, _ = _best_response_cell(p2_best_response, player1, action, hand,
+                                                     alternate_row, 2, self.ev_calc.showdown)
         
         # Check if exploitability is below threshold
         exploitability_1 = abs(ev_old_1 - ev_1_br)
         exploitability_2 = abs(ev_old_2 - ev_2_br)
         
-        print(f"Exploitability: P1={exploitability_1:.6f}, P2={exploitability_2:.6f}")
+        if verbose:
+            print(f"Exploitability: P1={exploitability_1:.6f}, P2={exploitability_2:.6f}")
         
         return exploitability_1 <= epsilon_threshold and exploitability_2 <= epsilon_threshold
 
 
+def _solve_batch_worker(solver: EquilibriumSolver, p1_batch: np.ndarray, p2_batch: np.ndarray,
+                        start_offset: int, settings: tuple) -> Tuple[List[List[Dict[str, Any]]], str]:
+    """
+    Run one worker's share of solve_batch, capturing its log.
+    
+    Workers run concurrently, so their output is buffered here and printed
+    by the parent in start order instead of interleaving on stdout.
+    
+    Returns:
+        Tuple of (results per start, captured log text)
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        results = solver._run_batch(p1_batch, p2_batch, *settings, start_offset=start_offset)
+    return results, log.getvalue()
+
+
+def deduplicate_equilibria(results: List[Dict[str, Any]],
+                           tolerance: float = 0.01) -> List[Dict[str, Any]]:
+    """
+    Drop equilibria that are within tolerance of one already kept.
+    
+    Two equilibria are considered the same when no probability in either
+    player's strategy differs by more than tolerance (L-infinity distance).
+    
+    Args:
+        results: Equilibria in the format returned by EquilibriumSolver.solve
+        tolerance: Maximum L-infinity distance between duplicates
+        
+    Returns:
+        The distinct equilibria, in their original order
+    """
+    distinct = []
+    for result in results:
+        if not any(np.abs(result['player1_strategy'] - kept['player1_strategy']).max() <= tolerance and
+                   np.abs(result['player2_strategy'] - kept['player2_strategy']).max() <= tolerance
+                   for kept in distinct):
+            distinct.append(result)
+    return distinct
+
+
 def main():
     """
     Main function to run the solver.
     """
+    import os
     import sys
     
     print("5-Card Kuhn Poker Solver")
@@ -745,24 +1281,38 @@ def main():
     # Check command line arguments for initialization type
     use_random = False
     random_seed = None
+    args = sys.argv[1:]
+    
+    # Number of starts to run in parallel (the chosen start plus perturbed copies)
+    restarts = 1
+    if "--restarts" in args:
+        index = args.index("--restarts")
+        try:
+            restarts = max(1, int(args[index + 1]))
+            del args[index + 1]
+        except (IndexError, ValueError):
+            print("Invalid number of restarts, using a single start")
+        del args[index]
     
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--random":
+    if args:
+        if args[0] == "--random":
             use_random = True
             print("\nUsing RANDOM starting strategies")
-            if len(sys.argv) > 2:
+            if len(args) > 1:
                 try:
-                    random_seed = int(sys.argv[2])
+                    random_seed = int(args[1])
                     print(f"Random seed: {random_seed}")
                 except ValueError:
                     print("Invalid seed, using random seed")
-        elif sys.argv[1] == "--help":
+        elif args[0] == "--help":
             print("\nUsage:")
             print("  python kuhn_poker_solver.py              # Use heuristic starting strategies")
             print("  python kuhn_poker_solver.py --random     # Use random starting strategies")
             print("  python kuhn_poker_solver.py --random 42  # Use random with seed 42")
+            print("  python kuhn_poker_solver.py --restarts 8 # Also solve from 7 perturbed starts")
             print("\nOptions:")
             print("  --random [seed]  Initialize with random strategies (optional seed for reproducibility)")
+            print("  --restarts N     Run N starts in parallel processes and merge their equilibria")
             print("  --help          Show this help message")
             return None
     else:
@@ -780,13 +1330,32 @@ def main():
     
     # Run solver
     print("\nStarting solver...")
-    results = solver.solve(
-        p1_start, p2_start,
-        max_iterations=10000,
-        max_equilibria=3,
-        epsilon=0.0001,
-        check_frequency=100
-    )
+    if restarts == 1:
+        results = solver.solve(
+            p1_start, p2_start,
+            max_iterations=10000,
+            max_equilibria=3,
+            epsilon=0.0001,
+            check_frequency=100
+        )
+    else:
+        # The hill climb can settle on different equilibria from nearby
+        # starts, so also solve from perturbed copies (seeded by index)
+        starts = [(p1_start, p2_start)] + [
+            solver.strategy_mgr.perturb_strategy(p1_start, p2_start, seed=index)
+            for index in range(1, restarts)
+        ]
+        all_results = solver.solve_batch(
+            np.stack([p1 for p1, _ in starts]),
+            np.stack([p2 for _, p2 in starts]),
+            max_iterations=10000,
+            max_equilibria=3,
+            epsilon=0.0001,
+            check_frequency=100,
+            max_workers=min(restarts, os.cpu_count() or 1)
+        )
+        results = deduplicate_equilibria([r for start_results in all_results
+                                          for r in start_results])
     
     # Display results
     print("\n" + "=" * 50)
@@ -798,9 +1367,9 @@ def main():
         print(f"\nIteration: {final['iteration']}")
         print(f"EVs: P1={final['ev_player1']:.6f}, P2={final['ev_player2']:.6f}")
         print("\nPlayer 1 Strategy:")
-        print(final['player1_strategy'])
+        print(solver.strategy_mgr.to_dataframe(final['player1_strategy'], 1))
         print("\nPlayer 2 Strategy:")
-        print(final['player2_strategy'])
+        print(solver.strategy_mgr.to_dataframe(final['player2_strategy'], 2))
     
     return results
 
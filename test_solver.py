@@ -2,7 +2,14 @@
 Quick test to verify the solver works correctly.
 """
 
-from kuhn_poker_solver import EquilibriumSolver
+import contextlib
+import io
+
+import numpy as np
+
+from kuhn_poker_solver import (EquilibriumSolver, _expected_value_loop, _expected_value_unrolled,
+                               _expected_value_vectorized, _self_play_batch, _self_play_iteration,
+                               deduplicate_equilibria)
 
 def test_basic_functionality():
     """Test basic solver functionality."""
@@ -15,14 +22,15 @@ def test_basic_functionality():
     
     # Test strategy matrix creation
     p1, p2 = solver.strategy_mgr.create_strategy_matrix()
+    assert isinstance(p1, np.ndarray) and isinstance(p2, np.ndarray), "Strategies should be arrays"
     assert p1.shape == (5, 5), "Player 1 strategy shape incorrect"
     assert p2.shape == (4, 5), "Player 2 strategy shape incorrect"
     print("✓ Strategy matrices created correctly")
     
     # Test default strategy initialization
     p1_start, p2_start = solver.strategy_mgr.initialize_default_strategy()
-    assert p1_start.iloc[4, 4] == 1.0, "Player 1 should always call with card 5"
-    assert p2_start.iloc[3, 0] == 1.0, "Player 2 should always fold with card 1"
+    assert p1_start[4, 4] == 1.0, "Player 1 should always call with card 5"
+    assert p2_start[3, 0] == 1.0, "Player 2 should always fold with card 1"
     print("✓ Default strategies initialized correctly")
     
     # Test EV calculation
@@ -55,5 +63,183 @@ def test_basic_functionality():
     
     return True
 
+def test_payoff_matrices():
+    """Test that the payoffs used by the EV kernels match the game engine."""
+    solver = EquilibriumSolver(n=5)
+    payoffs = solver.engine.payoffs
+    showdown = solver.ev_calc.showdown
+    distinct = 1.0 - np.eye(5)
+    assert np.array_equal(payoffs['bet_call'], 2 * showdown), "Bet/call should pay 2 to the winner"
+    assert np.array_equal(payoffs['bet_fold'], distinct), "Bet/fold should pay P1 the ante"
+    assert np.array_equal(payoffs['check_bet_call'], 2 * showdown), "Check/bet/call should pay 2"
+    assert np.array_equal(payoffs['check_bet_fold'], -distinct), "Check/bet/fold should cost P1 1"
+    assert np.array_equal(showdown, np.sign(np.subtract.outer(range(5), range(5)))), \
+        "Check/check should pay 1 to the higher card"
+    print("✓ Payoff matrices match the game engine")
+
+def test_ev_kernels_agree():
+    """Test that the vectorized and unrolled EV kernels match the loop kernel."""
+    solver = EquilibriumSolver(n=5)
+    showdown = solver.ev_calc.showdown
+    loop_kernel = getattr(_expected_value_loop, 'py_func', _expected_value_loop)
+    
+    for seed in range(5):
+        p1, p2 = solver.strategy_mgr.initialize_random_strategy(seed=seed)
+        ev1_loop, ev2_loop = loop_kernel(p1, p2, showdown)
+        ev1_vec, ev2_vec = _expected_value_vectorized(p1, p2, showdown)
+        ev1_unrolled, ev2_unrolled = _expected_value_unrolled(p1, p2, showdown)
+        assert abs(ev1_loop - ev1_vec) < 1e-12, "P1 EV mismatch between kernels"
+        assert abs(ev2_loop - ev2_vec) < 1e-12, "P2 EV mismatch between kernels"
+        assert abs(ev1_loop - ev1_unrolled) < 1e-12, "P1 EV mismatch with unrolled kernel"
+        assert abs(ev2_loop - ev2_unrolled) < 1e-12, "P2 EV mismatch with unrolled kernel"
+    print("✓ EV kernels agree")
+
+def test_calculate_ev_batch():
+    """Test that batched EVs match one calculate_ev call per pair."""
+    solver = EquilibriumSolver(n=5)
+    starts = [solver.strategy_mgr.initialize_random_strategy(seed=seed) for seed in range(4)]
+    p1_batch = np.stack([p1 for p1, _ in starts])
+    p2 = starts[0][1]
+    
+    ev1_batch, ev2_batch = solver.ev_calc.calculate_ev_batch(p1_batch, p2)
+    assert ev1_batch.shape == (4,), "One EV per Player 1 strategy"
+    for b, p1 in enumerate(p1_batch):
+        ev1, ev2 = solver.ev_calc.calculate_ev(p1, p2)
+        assert abs(ev1_batch[b] - ev1) < 1e-12 and abs(ev2_batch[b] - ev2) < 1e-12, "Batched EV mismatch"
+    print("✓ Batched EV calculation works")
+
+def test_batch_iteration_matches_single():
+    """Test that batched self-play updates each start like the single-start loop."""
+    solver = EquilibriumSolver(n=5)
+    showdown = solver.ev_calc.showdown
+    starts = [solver.strategy_mgr.initialize_random_strategy(seed=seed) for seed in range(3)]
+    p1_batch = np.stack([p1 for p1, _ in starts])
+    p2_batch = np.stack([p2 for _, p2 in starts])
+    active = np.array([True, False, True])
+    ev_1_batch = np.zeros(3)
+    
+    for _ in range(10):
+        _self_play_batch(p1_batch, p2_batch, ev_1_batch, active, 0.0001, showdown)
+    
+    for b, (p1, p2) in enumerate(starts):
+        if active[b]:
+            for _ in range(10):
+                p1, p2, ev_1 = _self_play_iteration(p1, p2, 0.0001, showdown)
+            ev_1_check, _ = solver.ev_calc.calculate_ev(p1, p2)
+            assert abs(ev_1 - ev_1_check) < 1e-12, "Returned EV should match the final strategies"
+            assert ev_1_batch[b] == ev_1, "Batched EV diverged"
+        assert np.array_equal(p1_batch[b], p1), "Batched P1 strategy diverged"
+        assert np.array_equal(p2_batch[b], p2), "Batched P2 strategy diverged"
+    print("✓ Batched iterations match single-start iterations")
+
+def test_solve_batch_workers():
+    """Test that splitting a batch across worker processes gives the in-process results."""
+    solver = EquilibriumSolver(n=5)
+    starts = [solver.strategy_mgr.initialize_random_strategy(seed=seed) for seed in (1, 2, 0)]
+    p1_starts = np.stack([p1 for p1, _ in starts])
+    p2_starts = np.stack([p2 for _, p2 in starts])
+    
+    all_results = {}
+    for max_workers in (None, 2):
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            all_results[max_workers] = solver.solve_batch(p1_starts, p2_starts, max_iterations=1500,
+                                                          epsilon=0.02, max_equilibria=1,
+                                                          max_workers=max_workers)
+    
+    # The last start runs in the second worker but keeps its global label
+    assert all_results[2][2], "Expected an equilibrium from start 2"
+    label = f"EQUILIBRIUM FOUND (start 2, iteration {all_results[2][2][0]['iteration']})"
+    assert label in log.getvalue(), "Wrong start label"
+    
+    for in_process, pooled in zip(all_results[None], all_results[2]):
+        assert len(in_process) == len(pooled), "Workers found different equilibria"
+        for r1, r2 in zip(in_process, pooled):
+            assert r1['iteration'] == r2['iteration'] and r1['ev_player1'] == r2['ev_player1']
+            assert np.array_equal(r1['player1_strategy'], r2['player1_strategy'])
+            assert np.array_equal(r1['player2_strategy'], r2['player2_strategy'])
+    print("✓ Worker processes match the in-process batch")
+
+def test_adaptive_check_interval():
+    """Test that checks thin out while strategies drift and stay regular once they settle."""
+    solver = EquilibriumSolver(n=5)
+    
+    def checked_iterations(p1, p2, **solve_kwargs):
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            results = solver.solve(p1, p2, max_iterations=1500, max_check_frequency=400, **solve_kwargs)
+        checks = [int(line.split()[-1].rstrip('.')) for line in log.getvalue().splitlines()
+                  if line.startswith("Checking for equilibrium")]
+        return results, checks
+    
+    # The default start moves steadily, so the interval doubles up to the cap
+    _, checks = checked_iterations(*solver.strategy_mgr.initialize_default_strategy())
+    assert checks == [100, 300, 700, 1100, 1500], "Interval should double while drifting"
+    
+    # This start oscillates near an equilibrium, so every 100th iteration is still checked
+    results, checks = checked_iterations(*solver.strategy_mgr.initialize_random_strategy(seed=0),
+                                         epsilon=0.02, max_equilibria=1)
+    assert results, "Settled start should still find its equilibrium"
+    assert checks == list(range(100, results[0]['iteration'] + 1, 100)), "Interval should stay at check_frequency"
+    print("✓ Adaptive check interval works")
+
+def test_warm_start_comparison():
+    """Test that a start warm from an earlier equilibrium converges where cold starts do not."""
+    from custom_solver import compare_strategies
+    
+    solver = EquilibriumSolver(n=5)
+    p1_start, p2_start = solver.strategy_mgr.initialize_random_strategy(seed=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = solver.solve(p1_start, p2_start, max_iterations=1500, epsilon=0.02, max_equilibria=1)
+    assert results, "Expected an equilibrium to warm-start from"
+    
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        compare_strategies(warm_start=(results[-1]['player1_strategy'], results[-1]['player2_strategy']))
+    comparison = log.getvalue().split("COMPARISON RESULTS")[1]
+    assert "Default Strategy:\n  No equilibrium found" in comparison, "Cold start should not converge"
+    assert "Warm Start Strategy:\n  First equilibrium at iteration:" in comparison, "Warm start should converge"
+    print("✓ Warm start converges within the comparison run")
+
+def test_float32_solver():
+    """Test that a float32 solver keeps its strategies in single precision."""
+    solver = EquilibriumSolver(n=5, dtype=np.float32)
+    p1_start, p2_start = solver.strategy_mgr.initialize_default_strategy()
+    assert p1_start.dtype == np.float32, "Strategies should use the solver dtype"
+    
+    ev1, ev2 = solver.ev_calc.calculate_ev(p1_start, p2_start)
+    ev1_64, _ = EquilibriumSolver(n=5).ev_calc.calculate_ev(p1_start, p2_start)
+    assert isinstance(ev1, float), "EV should be float"
+    assert abs(ev1 - ev1_64) < 1e-6, "float32 EV too far from float64 EV"
+    
+    p1, p2, _ = _self_play_iteration(p1_start, p2_start, 0.0001, solver.ev_calc.showdown)
+    assert p1.dtype == np.float32 and p2.dtype == np.float32, "Kernel changed dtype"
+    print("✓ float32 solver works")
+
+def test_restart_helpers():
+    """Test perturbed restarts keep valid strategies and duplicates are merged."""
+    solver = EquilibriumSolver(n=5)
+    p1_start, p2_start = solver.strategy_mgr.initialize_default_strategy()
+    p1, p2 = solver.strategy_mgr.perturb_strategy(p1_start, p2_start, noise=0.05, seed=1)
+    assert np.allclose(p1[0] + p1[1], 1.0) and np.allclose(p1[3] + p1[4], 1.0), "P1 rows must sum to 1"
+    assert np.allclose(p2[0] + p2[1], 1.0) and np.allclose(p2[2] + p2[3], 1.0), "P2 rows must sum to 1"
+    assert p1[4, 4] == 1.0 and p2[3, 0] == 1.0, "Fixed probabilities should not be perturbed"
+    assert 0 < np.abs(p1 - p1_start).max() <= 0.05, "Perturbation should stay within the noise"
+    
+    results = [{'player1_strategy': p1_start, 'player2_strategy': p2_start},
+               {'player1_strategy': p1_start + 0.005, 'player2_strategy': p2_start},
+               {'player1_strategy': p1, 'player2_strategy': p2}]
+    assert len(deduplicate_equilibria(results, tolerance=0.01)) == 2, "Near-duplicates should merge"
+    print("✓ Restart helpers work")
+
 if __name__ == "__main__":
     test_basic_functionality()
+    test_payoff_matrices()
+    test_ev_kernels_agree()
+    test_calculate_ev_batch()
+    test_batch_iteration_matches_single()
+    test_solve_batch_workers()
+    test_adaptive_check_interval()
+    test_warm_start_comparison()
+    test_float32_solver()
+    test_restart_helpers()